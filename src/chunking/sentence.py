@@ -2,6 +2,9 @@
 
 import re
 
+# Sentence boundary pattern, compiled once at import rather than per call.
+_SENTENCE_RE = re.compile(r"([^.!?\n]+[.!?\n]?)", re.M)
+
 
 def _split_sentences(text: str) -> list[tuple[int, int]]:
     """Return list of sentence spans as (start, end) offsets.
@@ -13,8 +16,7 @@ def _split_sentences(text: str) -> list[tuple[int, int]]:
     This avoids heavy NLP deps and is deterministic for tests.
     """
     sentences: list[tuple[int, int]] = []
-    pattern = re.compile(r"([^.!?\n]+[.!?\n]?)", re.M)
-    for m in pattern.finditer(text):
+    for m in _SENTENCE_RE.finditer(text):
         start = m.start()
         end = m.end()
         sentences.append((start, end))
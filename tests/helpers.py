@@ -3,10 +3,32 @@
 
 import os
 import asyncio
+import socket
+from functools import lru_cache
+from urllib.parse import urlparse
 
 
+@lru_cache(maxsize=1)
 def is_milvus_running() -> bool:
-    """Check if a Milvus instance is running and accessible."""
+    """Check if a Milvus instance is running and accessible.
+
+    For network URIs this is a plain TCP connect to the Milvus port, which
+    avoids importing pymilvus and starting an event loop. File-backed URIs
+    (Milvus Lite) fall back to the client-based check. The result is cached
+    for the lifetime of the test process.
+    """
+    milvus_uri = os.environ.get("MILVUS_URI", "milvus_demo.db")
+    parsed = urlparse(milvus_uri)
+    if parsed.scheme in ("http", "https", "tcp", "grpc") and parsed.hostname:
+        timeout = float(os.environ.get("MILVUS_CONNECT_TIMEOUT", "3"))
+        try:
+            with socket.create_connection(
+                (parsed.hostname, parsed.port or 19530), timeout=timeout
+            ):
+                return True
+        except (OSError, ValueError):
+            return False
+
     try:
         return asyncio.run(is_milvus_running_async())
     except Exception:
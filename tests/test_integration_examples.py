@@ -5,6 +5,7 @@ import warnings
 import sys
 import os
 import subprocess
+from functools import lru_cache
 from unittest.mock import patch
 
 # Suppress Pydantic deprecation warnings from dependencies
@@ -25,6 +26,17 @@ import pytest
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+EXAMPLES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples"
+)
+
+
+@lru_cache(maxsize=None)
+def _read_example(example_file: str) -> str:
+    """Return the contents of an example file, reading it once per session."""
+    with open(os.path.join(EXAMPLES_DIR, example_file), "r") as f:
+        return f.read()
+
 
 @pytest.mark.integration
 class TestIntegrationExamples:
@@ -41,13 +53,12 @@ class TestIntegrationExamples:
         assert os.path.exists(example_path), "Milvus example file should exist"
 
         # Check that the file can be imported
-        with open(example_path, "r") as f:
-            content = f.read()
-            assert "create_vector_database" in content, (
-                "Should import create_vector_database"
-            )
-            assert "milvus" in content, "Should use Milvus database"
-            assert "main()" in content, "Should have main function"
+        content = _read_example("milvus_example.py")
+        assert "create_vector_database" in content, (
+            "Should import create_vector_database"
+        )
+        assert "milvus" in content, "Should use Milvus database"
+        assert "main()" in content, "Should have main function"
 
     def test_weaviate_example_structure(self) -> None:
         """Test that the Weaviate example file exists and has correct structure."""
@@ -60,13 +71,12 @@ class TestIntegrationExamples:
         assert os.path.exists(example_path), "Weaviate example file should exist"
 
         # Check that the file can be imported
-        with open(example_path, "r") as f:
-            content = f.read()
-            assert "create_vector_database" in content, (
-                "Should import create_vector_database"
-            )
-            assert "weaviate" in content, "Should use Weaviate database"
-            assert "main()" in content, "Should have main function"
+        content = _read_example("weaviate_example.py")
+        assert "create_vector_database" in content, (
+            "Should import create_vector_database"
+        )
+        assert "weaviate" in content, "Should use Weaviate database"
+        assert "main()" in content, "Should have main function"
 
     def test_milvus_example_imports_and_runs(self) -> None:
         """Test that the Milvus example can be imported and runs without errors."""
@@ -161,98 +171,63 @@ class TestIntegrationExamples:
 
     def test_examples_import_structure(self) -> None:
         """Test that examples use the correct import structure."""
-        examples_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples"
-        )
-
         for example_file in ["milvus_example.py", "weaviate_example.py"]:
-            example_path = os.path.join(examples_dir, example_file)
-
-            with open(example_path, "r") as f:
-                content = f.read()
+            content = _read_example(example_file)
 
-                # Check for correct import path
-                assert (
-                    "from src.db.vector_db_factory import create_vector_database"
-                    in content
-                ), f"{example_file} should use correct import path"
+            # Check for correct import path
+            assert (
+                "from src.db.vector_db_factory import create_vector_database"
+                in content
+            ), f"{example_file} should use correct import path"
 
-                # Check for proper sys.path manipulation
-                assert "sys.path.append" in content, (
-                    f"{example_file} should include sys.path manipulation"
-                )
+            # Check for proper sys.path manipulation
+            assert "sys.path.append" in content, (
+                f"{example_file} should include sys.path manipulation"
+            )
 
     def test_examples_error_handling(self) -> None:
         """Test that examples have proper error handling."""
-        examples_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples"
-        )
-
         for example_file in ["milvus_example.py", "weaviate_example.py"]:
-            example_path = os.path.join(examples_dir, example_file)
+            content = _read_example(example_file)
 
-            with open(example_path, "r") as f:
-                content = f.read()
-
-                # Check for try-except blocks
-                assert "try:" in content, f"{example_file} should have error handling"
-                assert "except" in content, f"{example_file} should have error handling"
-                assert "finally:" in content, f"{example_file} should have cleanup"
+            # Check for try-except blocks
+            assert "try:" in content, f"{example_file} should have error handling"
+            assert "except" in content, f"{example_file} should have error handling"
+            assert "finally:" in content, f"{example_file} should have cleanup"
 
     def test_examples_cleanup(self) -> None:
         """Test that examples have proper cleanup."""
-        examples_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples"
-        )
-
         for example_file in ["milvus_example.py", "weaviate_example.py"]:
-            example_path = os.path.join(examples_dir, example_file)
-
-            with open(example_path, "r") as f:
-                content = f.read()
+            content = _read_example(example_file)
 
-                # Check for cleanup calls
-                assert "db.cleanup()" in content, f"{example_file} should call cleanup"
+            # Check for cleanup calls
+            assert "db.cleanup()" in content, f"{example_file} should call cleanup"
 
     def test_examples_document_operations(self) -> None:
         """Test that examples demonstrate document operations."""
-        examples_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples"
-        )
-
         for example_file in ["milvus_example.py", "weaviate_example.py"]:
-            example_path = os.path.join(examples_dir, example_file)
+            content = _read_example(example_file)
 
-            with open(example_path, "r") as f:
-                content = f.read()
-
-                # Check for document operations
-                assert "write_documents" in content, (
-                    f"{example_file} should demonstrate document writing"
-                )
-                assert "list_documents" in content, (
-                    f"{example_file} should demonstrate document listing"
-                )
-                assert "count_documents" in content, (
-                    f"{example_file} should demonstrate document counting"
-                )
-                assert "delete_document" in content, (
-                    f"{example_file} should demonstrate document deletion"
-                )
+            # Check for document operations
+            assert "write_documents" in content, (
+                f"{example_file} should demonstrate document writing"
+            )
+            assert "list_documents" in content, (
+                f"{example_file} should demonstrate document listing"
+            )
+            assert "count_documents" in content, (
+                f"{example_file} should demonstrate document counting"
+            )
+            assert "delete_document" in content, (
+                f"{example_file} should demonstrate document deletion"
+            )
 
     def test_examples_output_format(self) -> None:
         """Test that examples have proper output formatting."""
-        examples_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples"
-        )
-
         for example_file in ["milvus_example.py", "weaviate_example.py"]:
-            example_path = os.path.join(examples_dir, example_file)
-
-            with open(example_path, "r") as f:
-                content = f.read()
+            content = _read_example(example_file)
 
-                # Check for proper output formatting
-                assert "print(" in content, f"{example_file} should have output"
-                assert "✅" in content, f"{example_file} should have success indicators"
-                assert "❌" in content, f"{example_file} should have error indicators"
+            # Check for proper output formatting
+            assert "print(" in content, f"{example_file} should have output"
+            assert "✅" in content, f"{example_file} should have success indicators"
+            assert "❌" in content, f"{example_file} should have error indicators"